@@ -40,7 +40,7 @@ echo -e "${YELLOW}📦 Installing system dependencies...${NC}"
 sudo apt update -qq
 sudo apt install -y python3-gi gir1.2-gtk-3.0 gir1.2-gstreamer-1.0 \
     gir1.2-ayatanaappindicator3-0.1 gstreamer1.0-plugins-good \
-    gstreamer1.0-plugins-base libnotify-bin
+    gstreamer1.0-plugins-base gir1.2-notify-0.7 libnotify-bin
 
 echo -e "${GREEN}✅ System dependencies installed${NC}"
 echo ""
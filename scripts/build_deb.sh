@@ -27,7 +27,7 @@ Version: $VERSION
 Section: utils
 Priority: optional
 Architecture: all
-Depends: python3 (>= 3.10), python3-gi, gir1.2-gtk-3.0, gir1.2-gst-1.0, gir1.2-ayatanaappindicator3-0.1, gstreamer1.0-plugins-good, gstreamer1.0-plugins-base, libnotify-bin
+Depends: python3 (>= 3.10), python3-gi, gir1.2-gtk-3.0, gir1.2-gst-1.0, gir1.2-ayatanaappindicator3-0.1, gstreamer1.0-plugins-good, gstreamer1.0-plugins-base, gir1.2-notify-0.7, libnotify-bin
 Maintainer: Hridoy Varaby <contact@varabit.com>
 Homepage: https://varabit.com
 Description: Schedule Voice Clock - Time announcements in English and Bangla
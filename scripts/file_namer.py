@@ -9,6 +9,30 @@ Output: 48 filenames per language (12 hours × 4 intervals)
 Format: HH_MM.ogg (01_00.ogg, 01_15.ogg, ..., 12_45.ogg)
 """
 
+import sys
+from itertools import product
+
+
+def _build_filenames(interval: int) -> tuple[str, ...]:
+    """
+    Build the audio filenames for a 12-hour cycle.
+    
+    Args:
+        interval: Minutes between announcements.
+        
+    Returns:
+        Tuple of filenames in HH_MM.ogg format.
+    """
+    hours = range(1, 13)  # 1 to 12
+    minutes = range(0, 60, interval)
+    return tuple(
+        f"{hour:02d}_{minute:02d}.ogg" for hour, minute in product(hours, minutes)
+    )
+
+
+# Precomputed filenames for every supported interval
+_FILENAMES = {interval: _build_filenames(interval) for interval in (15, 30, 60)}
+
 
 def generate_filenames(interval: int = 15) -> list[str]:
     """
@@ -20,51 +44,46 @@ def generate_filenames(interval: int = 15) -> list[str]:
     Returns:
         List of filenames in HH_MM.ogg format.
     """
-    filenames = []
-    
-    for hour in range(1, 13):  # 1 to 12
-        for minute in range(0, 60, interval):
-            filename = f"{hour:02d}_{minute:02d}.ogg"
-            filenames.append(filename)
-    
-    return filenames
+    filenames = _FILENAMES.get(interval)
+    if filenames is None:
+        filenames = _build_filenames(interval)
+    return list(filenames)
 
 
 def main():
     """Print all required filenames as a checklist."""
-    print("=" * 60)
-    print("VoiceClock Audio Filename Checklist")
-    print("=" * 60)
-    print()
-    
     # Generate for 15-minute intervals (covers all possible times)
-    filenames = generate_filenames(interval=15)
-    
-    print(f"Total files needed per language: {len(filenames)}")
-    print()
-    print("📁 English files (assets/audio/en/):")
-    print("-" * 40)
-    for i, name in enumerate(filenames, 1):
-        print(f"  [ ] {name}")
-    
-    print()
-    print("📁 Bangla files (assets/audio/bn/):")
-    print("-" * 40)
-    for i, name in enumerate(filenames, 1):
-        print(f"  [ ] {name}")
-    
-    print()
-    print("=" * 60)
-    print("TIP: Use ElevenLabs to generate these voice clips.")
-    print("     Example text for 01_15.ogg: 'The time is one fifteen'")
-    print("     Example text for 12_00.ogg: 'The time is twelve o'clock'")
-    print("=" * 60)
+    filenames = _FILENAMES[15]
+    checklist = [f"  [ ] {name}" for name in filenames]
     
-    # Also output as a simple list for scripting
-    print()
-    print("📋 Plain list (for scripting):")
-    print("-" * 40)
-    print(", ".join(filenames))
+    # Collect the whole report and write it in one call
+    lines = [
+        "=" * 60,
+        "VoiceClock Audio Filename Checklist",
+        "=" * 60,
+        "",
+        f"Total files needed per language: {len(filenames)}",
+        "",
+        "📁 English files (assets/audio/en/):",
+        "-" * 40,
+        *checklist,
+        "",
+        "📁 Bangla files (assets/audio/bn/):",
+        "-" * 40,
+        *checklist,
+        "",
+        "=" * 60,
+        "TIP: Use ElevenLabs to generate these voice clips.",
+        "     Example text for 01_15.ogg: 'The time is one fifteen'",
+        "     Example text for 12_00.ogg: 'The time is twelve o'clock'",
+        "=" * 60,
+        # Also output as a simple list for scripting
+        "",
+        "📋 Plain list (for scripting):",
+        "-" * 40,
+        ", ".join(filenames),
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
@@ -13,13 +13,46 @@ Usage:
     5. Run: python3 scripts/generate_audio.py
 """
 
+import asyncio
+import hashlib
+import importlib.util
+import json
 import os
-import time
+import random
+import shutil
+import sys
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import Generator
+from typing import AsyncIterator, Awaitable, Callable, Optional
 
 from dotenv import load_dotenv
 
+# ElevenLabs SDK and its HTTP client (only required when DRY_RUN is False)
+try:
+    import httpx
+    from elevenlabs import VoiceSettings
+    from elevenlabs.client import AsyncElevenLabs
+except ImportError:
+    httpx = None
+    VoiceSettings = None
+    AsyncElevenLabs = None
+
+# HTTP/2 multiplexing needs the optional 'h2' package (pip install httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Resolve project paths once at import
+_SCRIPT_DIR = Path(__file__).resolve().parent
+_PROJECT_ROOT = _SCRIPT_DIR.parent
+_ASSETS_DIR = _PROJECT_ROOT / "assets" / "audio"
+# Kept outside assets/ so the installer doesn't ship it
+_CACHE_DIR = _PROJECT_ROOT / ".cache" / "audio"
+
+# Add project root to path for absolute imports
+sys.path.insert(0, str(_PROJECT_ROOT))
+
+from src.tts_text import BANGLA_TEXTS, ENGLISH_TEXTS
+
 # Load environment variables from .env
 load_dotenv()
 
@@ -41,247 +74,287 @@ MODEL_ID_BN = "eleven_v3"               # For Bangla (Eleven v3 alpha)
 # Output format
 OUTPUT_FORMAT = "mp3_44100_128"
 
-# Rate limiting delay (seconds between API calls)
-API_DELAY = 0.5
+# Maximum number of API requests in flight at once.
+# Match this to your ElevenLabs plan's concurrency limit.
+CONCURRENCY = 5
+
+# Request timeout in seconds (matches the SDK default)
+REQUEST_TIMEOUT = 240.0
+
+# Retry policy for rate-limited (429) or overloaded (503) API responses
+MAX_RETRIES = 5
+BASE_DELAY = 1.0    # seconds, doubled on each attempt
+MAX_DELAY = 60.0    # upper bound for a single backoff
+JITTER = 0.5        # random extra seconds to spread out retries
 
 # Languages to generate
 GENERATE_ENGLISH = False  # Already done
 GENERATE_BANGLA = True
 
 # =============================================================================
-# BANGLA NUMBER MAPPINGS
+# AUDIO GENERATION
 # =============================================================================
 
-# Bangla numerals for hours (1-12)
-BANGLA_HOURS = {
-    1: "একটা",
-    2: "দুইটা",
-    3: "তিনটা",
-    4: "চারটা",
-    5: "পাঁচটা",
-    6: "ছয়টা",
-    7: "সাতটা",
-    8: "আটটা",
-    9: "নয়টা",
-    10: "দশটা",
-    11: "এগারোটা",
-    12: "বারোটা",
-}
-
-# Bangla minute phrases
-BANGLA_MINUTES = {
-    0: "",  # No minute suffix for :00
-    15: "বেজে পনেরো মিনিট",
-    30: "বেজে ত্রিশ মিনিট",
-    45: "বেজে পঁয়তাল্লিশ মিনিট",
-}
-
-
-def get_bangla_time_of_day(hour_24: int) -> str:
+RETRYABLE_STATUS = (429, 503)
+
+
+def _get_status_code(error: Exception) -> Optional[int]:
     """
-    Get the Bangla time-of-day phrase based on 24-hour time.
+    Extract the HTTP status code from an ElevenLabs/httpx error.
     
     Args:
-        hour_24: Hour in 24-hour format (0-23).
+        error: The exception raised by the API call.
         
     Returns:
-        Bangla time-of-day string.
+        Status code, or None if the error carries no HTTP response.
     """
-    if 4 <= hour_24 <= 5:
-        return "ভোর"      # Bhor (Dawn) - 4:00 to 5:59
-    elif 6 <= hour_24 <= 11:
-        return "সকাল"    # Morning - 6:00 to 11:59
-    elif 12 <= hour_24 <= 15:
-        return "দুপুর"   # Noon/Afternoon - 12:00 to 15:59
-    elif 16 <= hour_24 <= 17:
-        return "বিকেল"   # Late Afternoon - 16:00 to 17:59
-    elif 18 <= hour_24 <= 19:
-        return "সন্ধ্যা"  # Evening - 18:00 to 19:59
-    else:
-        return "রাত"     # Night - 20:00 to 3:59
+    status = getattr(error, "status_code", None)
+    if status is None:
+        response = getattr(error, "response", None)
+        status = getattr(response, "status_code", None)
+    return status
 
 
-def get_bangla_text(hour_24: int, minute: int) -> str:
+def _get_retry_after(error: Exception) -> Optional[float]:
     """
-    Generate Bangla text for a given time.
+    Read the Retry-After header (seconds or HTTP date) from an error.
     
     Args:
-        hour_24: Hour in 24-hour format (0-23).
-        minute: Minute (0, 15, 30, 45).
+        error: The exception raised by the API call.
         
     Returns:
-        Bangla text string for TTS.
+        Delay in seconds, or None if the header is absent or invalid.
     """
-    # Convert to 12-hour format
-    hour_12 = hour_24 % 12
-    if hour_12 == 0:
-        hour_12 = 12
+    headers = getattr(error, "headers", None)
+    if headers is None:
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None)
+    if not headers:
+        return None
     
-    time_of_day = get_bangla_time_of_day(hour_24)
-    hour_word = BANGLA_HOURS[hour_12]
+    value = headers.get("retry-after") or headers.get("Retry-After")
+    if value is None:
+        return None
     
-    if minute == 0:
-        # "এখন সময় দুপুর দুইটা"
-        return f"এখন সময় {time_of_day} {hour_word}"
-    else:
-        # "এখন সময় দুপুর দুইটা বেজে পনেরো মিনিট"
-        minute_phrase = BANGLA_MINUTES[minute]
-        # Remove "টা" suffix for minute phrases (use base form)
-        hour_base = hour_word.replace("টা", "টা")
-        return f"এখন সময় {time_of_day} {hour_base} {minute_phrase}"
-
-
-# =============================================================================
-# ENGLISH TEXT GENERATION
-# =============================================================================
-
-ENGLISH_HOURS = {
-    1: "one", 2: "two", 3: "three", 4: "four", 5: "five", 6: "six",
-    7: "seven", 8: "eight", 9: "nine", 10: "ten", 11: "eleven", 12: "twelve",
-}
-
-ENGLISH_MINUTES = {
-    0: "o'clock",
-    15: "fifteen",
-    30: "thirty",
-    45: "forty-five",
-}
-
-
-def get_english_period(hour_24: int) -> str:
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+async def with_rate_limit(
+    op: Callable[[], Awaitable],
+    max_retries: int = MAX_RETRIES,
+    base_delay: float = BASE_DELAY,
+    max_delay: float = MAX_DELAY,
+    jitter: float = JITTER
+):
     """
-    Get AM/PM and descriptive period for English.
+    Run an API operation, backing off only when the API throttles.
+    
+    Retries on HTTP 429/503, honoring Retry-After when present and
+    otherwise using exponential backoff with jitter. Any other error
+    is raised immediately.
     
     Args:
-        hour_24: Hour in 24-hour format (0-23).
+        op: Zero-argument coroutine function performing the request.
+        max_retries: Maximum number of retries before giving up.
+        base_delay: Initial backoff delay in seconds.
+        max_delay: Upper bound for a single backoff delay.
+        jitter: Maximum random seconds added to each backoff.
         
     Returns:
-        Period string (e.g., "in the morning", "PM").
+        The result of op().
     """
-    if 0 <= hour_24 <= 4:
-        return "at night"
-    elif 5 <= hour_24 <= 11:
-        return "in the morning"
-    elif hour_24 == 12:
-        return "in the afternoon"
-    elif 13 <= hour_24 <= 17:
-        return "in the afternoon"
-    elif 18 <= hour_24 <= 20:
-        return "in the evening"
-    else:
-        return "at night"
+    for attempt in range(max_retries + 1):
+        try:
+            return await op()
+        except Exception as e:
+            if attempt == max_retries or _get_status_code(e) not in RETRYABLE_STATUS:
+                raise
+            
+            delay = _get_retry_after(e)
+            if delay is None:
+                delay = base_delay * 2 ** attempt + random.random() * jitter
+            delay = min(delay, max_delay)
+            
+            print(f"  ⏳ Throttled ({_get_status_code(e)}), retrying in {delay:.1f}s...")
+            await asyncio.sleep(delay)
 
 
-def get_english_text(hour_24: int, minute: int) -> str:
+def _settings_to_dict(voice_settings) -> Optional[dict]:
     """
-    Generate natural English text for a given time.
+    Convert VoiceSettings into a plain dict for hashing.
     
     Args:
-        hour_24: Hour in 24-hour format (0-23).
-        minute: Minute (0, 15, 30, 45).
+        voice_settings: VoiceSettings instance, dict, or None.
         
     Returns:
-        English text string for TTS.
+        JSON-serializable dict, or None if no settings were given.
     """
-    # Convert to 12-hour format
-    hour_12 = hour_24 % 12
-    if hour_12 == 0:
-        hour_12 = 12
+    if voice_settings is None or isinstance(voice_settings, dict):
+        return voice_settings
+    if hasattr(voice_settings, "model_dump"):
+        return voice_settings.model_dump()
+    return voice_settings.dict()
+
+
+async def _stream_to_file(chunks: AsyncIterator[bytes], path: Path) -> None:
+    """
+    Write audio chunks to disk as they arrive from the API.
     
-    hour_word = ENGLISH_HOURS[hour_12]
-    period = get_english_period(hour_24)
+    The data goes to a temporary file that is renamed into place once
+    complete, so a partial download is never left at the final path.
     
-    if minute == 0:
-        # "It is two o'clock in the afternoon"
-        return f"It is {hour_word} o'clock {period}"
-    else:
-        # "It is two fifteen in the afternoon"
-        minute_word = ENGLISH_MINUTES[minute]
-        return f"It is {hour_word} {minute_word} {period}"
-
+    Args:
+        chunks: Async iterator of audio byte chunks.
+        path: Destination file.
+    """
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            async for chunk in chunks:
+                f.write(chunk)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
-# =============================================================================
-# AUDIO GENERATION
-# =============================================================================
 
-def generate_time_slots() -> Generator[tuple[int, int], None, None]:
+def cache_key(text: str, voice_id: str, model_id: str, fmt: str, settings) -> str:
     """
-    Generate all time slots for a 24-hour cycle at 15-minute intervals.
+    Build a content-addressed cache key for a TTS request.
+    
+    Any change to the text, voice, model, format or voice settings
+    yields a different key, so stale audio is never reused.
     
-    Yields:
-        Tuples of (hour, minute) for each time slot.
+    Args:
+        text: Text to convert to speech.
+        voice_id: Voice ID.
+        model_id: Model ID.
+        fmt: Output format.
+        settings: Optional VoiceSettings.
+        
+    Returns:
+        Hex SHA-256 digest identifying the request.
     """
-    for hour in range(24):
-        for minute in (0, 15, 30, 45):
-            yield hour, minute
+    payload = json.dumps(
+        [text, voice_id, model_id, fmt, _settings_to_dict(settings)],
+        ensure_ascii=False,
+        sort_keys=True
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
 
-def generate_audio_file(
+async def generate_audio_file_async(
     client,
+    sem: asyncio.Semaphore,
     text: str,
     voice_id: str,
     output_path: Path,
     model_id: str,
+    cache_dir: Path,
     voice_settings=None
 ) -> bool:
     """
-    Generate audio file using ElevenLabs API.
+    Generate audio file using the async ElevenLabs API.
+    
+    Previously synthesized clips are served from the on-disk cache
+    without calling the API.
     
     Args:
-        client: ElevenLabs client instance.
+        client: AsyncElevenLabs client instance.
+        sem: Semaphore bounding the number of concurrent requests.
         text: Text to convert to speech.
         voice_id: Voice ID to use.
-        output_path: Path to save the audio file.
+        output_path: Path to save the audio file (directory must exist).
         model_id: Model ID to use.
+        cache_dir: Directory holding cached audio, keyed by request hash
+            (must exist).
         voice_settings: Optional VoiceSettings for customization.
         
     Returns:
         True if successful.
     """
-    try:
-        from elevenlabs import save
-        
-        kwargs = {
-            "voice_id": voice_id,
-            "text": text,
-            "model_id": model_id,
-            "output_format": OUTPUT_FORMAT,
-        }
-        
-        if voice_settings:
-            kwargs["voice_settings"] = voice_settings
-        
-        audio = client.text_to_speech.convert(**kwargs)
-        
-        # Ensure directory exists
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Save to file
-        save(audio, str(output_path))
-        
-        return True
+    label = f"{output_path.parent.name}/{output_path.name}"
+    key = cache_key(text, voice_id, model_id, OUTPUT_FORMAT, voice_settings)
+    cache_path = cache_dir / f"{key}{output_path.suffix}"
+    
+    if cache_path.exists():
+        try:
+            await asyncio.to_thread(shutil.copyfile, cache_path, output_path)
+            print(f"  ♻️ {label} (cached)")
+            return True
+        except OSError as e:
+            print(f"  ❌ {label}: {e}")
+            return False
+    
+    async with sem:
+        try:
+            kwargs = {
+                "voice_id": voice_id,
+                "text": text,
+                "model_id": model_id,
+                "output_format": OUTPUT_FORMAT,
+            }
+            
+            if voice_settings:
+                kwargs["voice_settings"] = voice_settings
+            
+            async def request() -> None:
+                # Stream straight into the cache; the response body is
+                # part of the request, so a throttled stream is retried whole
+                audio = client.text_to_speech.convert(**kwargs)
+                await _stream_to_file(audio, cache_path)
+            
+            await with_rate_limit(request)
+            
+            # Copy into place without blocking the event loop
+            await asyncio.to_thread(shutil.copyfile, cache_path, output_path)
+            
+            print(f"  ✅ {label}")
+            return True
+            
+        except Exception as e:
+            print(f"  ❌ {label}: {e}")
+            return False
+
+
+def format_preview(texts: tuple[tuple[int, int, str, str], ...]) -> str:
+    """
+    Format a precomputed text table for dry-run review.
+    
+    Args:
+        texts: Table of (hour, minute, filename, text) entries.
         
-    except Exception as e:
-        print(f"  ❌ Error: {e}")
-        return False
+    Returns:
+        One preview line per slot, joined for a single write.
+    """
+    return "\n".join(f"  {filename}: \"{text}\"" for _, _, filename, text in texts)
 
 
-def main():
+async def main():
     """Main entry point."""
     print("=" * 60)
     print("VoiceClock Audio Generator")
     print("=" * 60)
     print()
     
+    http_client = None
+    
     if DRY_RUN:
         print("🔍 DRY RUN MODE - No API calls will be made")
         print("   Review the generated text below, then set DRY_RUN = False")
         print()
     else:
-        # Import and initialize ElevenLabs client
-        try:
-            from elevenlabs.client import ElevenLabs
-        except ImportError:
+        # Initialize ElevenLabs client
+        if AsyncElevenLabs is None:
             print("❌ Error: elevenlabs package not installed")
             print("   Run: pip install elevenlabs python-dotenv")
             return
@@ -292,51 +365,62 @@ def main():
             print("   Create a .env file with: ELEVENLABS_API_KEY=your_key_here")
             return
         
-        client = ElevenLabs(api_key=api_key)
-        print("✅ ElevenLabs client initialized")
+        # One long-lived connection pool sized to the concurrency limit, so
+        # requests reuse warm TLS sessions instead of handshaking each time
+        limits = httpx.Limits(
+            max_connections=CONCURRENCY,
+            max_keepalive_connections=CONCURRENCY
+        )
+        http_client = httpx.AsyncClient(
+            limits=limits,
+            timeout=REQUEST_TIMEOUT,
+            http2=HTTP2_AVAILABLE
+        )
+        client = AsyncElevenLabs(api_key=api_key, httpx_client=http_client)
+        sem = asyncio.Semaphore(CONCURRENCY)
+        print(f"✅ ElevenLabs client initialized (concurrency: {CONCURRENCY})")
         print()
     
-    # Get script directory and project root
-    script_dir = Path(__file__).parent
-    project_root = script_dir.parent
-    assets_dir = project_root / "assets" / "audio"
+    # Create output directories once, not per file
+    if not DRY_RUN:
+        for directory in (_ASSETS_DIR / "en", _ASSETS_DIR / "bn", _CACHE_DIR):
+            directory.mkdir(parents=True, exist_ok=True)
     
     # Count totals
     total_files = 24 * 4  # 96 files per language
     generated = 0
     failed = 0
     
-    # Generate English files
+    # Both languages share one task pool so the semaphore keeps every
+    # concurrency slot busy instead of draining English before Bangla
+    tasks = []
+    
+    # Queue English files
     if GENERATE_ENGLISH:
         print("📁 ENGLISH FILES")
         print("-" * 40)
         
-        for hour, minute in generate_time_slots():
-            filename = f"{hour:02d}_{minute:02d}.mp3"
-            output_path = assets_dir / "en" / filename
-            text = get_english_text(hour, minute)
-            
-            if DRY_RUN:
-                print(f"  {filename}: \"{text}\"")
-            else:
-                print(f"  Generating {filename}...", end=" ", flush=True)
-                if generate_audio_file(client, text, VOICE_ID_EN, output_path, MODEL_ID_EN):
-                    print("✅")
-                    generated += 1
-                else:
-                    failed += 1
-                time.sleep(API_DELAY)
-        
+        if DRY_RUN:
+            print(format_preview(ENGLISH_TEXTS))
+        else:
+            for hour, minute, filename, text in ENGLISH_TEXTS:
+                output_path = _ASSETS_DIR / "en" / filename
+                tasks.append(generate_audio_file_async(
+                    client, sem, text, VOICE_ID_EN, output_path, MODEL_ID_EN,
+                    _CACHE_DIR
+                ))
+            print(f"  Queued {len(ENGLISH_TEXTS)} files")
         print()
     
-    # Generate Bangla files
+    # Queue Bangla files
     if GENERATE_BANGLA:
         print("📁 BANGLA FILES (বাংলা)")
         print("-" * 40)
         
-        # Import VoiceSettings for v3 model
-        if not DRY_RUN:
-            from elevenlabs import VoiceSettings
+        if DRY_RUN:
+            print(format_preview(BANGLA_TEXTS))
+        else:
+            # VoiceSettings for v3 model
             bangla_voice_settings = VoiceSettings(
                 stability=0.5,  # v3 requires 0.0, 0.5, or 1.0
                 similarity_boost=0.8,
@@ -344,27 +428,38 @@ def main():
                 speed=0.8,  # Slower speech
                 use_speaker_boost=True
             )
-        else:
-            bangla_voice_settings = None
-        
-        for hour, minute in generate_time_slots():
-            filename = f"{hour:02d}_{minute:02d}.mp3"
-            output_path = assets_dir / "bn" / filename
-            text = get_bangla_text(hour, minute)
             
-            if DRY_RUN:
-                print(f"  {filename}: \"{text}\"")
-            else:
-                print(f"  Generating {filename}...", end=" ", flush=True)
-                if generate_audio_file(client, text, VOICE_ID_BN, output_path, MODEL_ID_BN, bangla_voice_settings):
-                    print("✅")
-                    generated += 1
-                else:
-                    failed += 1
-                time.sleep(API_DELAY)
-        
+            for hour, minute, filename, text in BANGLA_TEXTS:
+                output_path = _ASSETS_DIR / "bn" / filename
+                tasks.append(generate_audio_file_async(
+                    client, sem, text, VOICE_ID_BN, output_path, MODEL_ID_BN,
+                    _CACHE_DIR, bangla_voice_settings
+                ))
+            print(f"  Queued {len(BANGLA_TEXTS)} files")
         print()
     
+    # Generate all queued files in a single batch; the connection pool is
+    # closed even if generation is cancelled or interrupted
+    try:
+        if tasks:
+            print(f"🎙️ Generating {len(tasks)} files...")
+            print()
+            
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            generated = sum(1 for result in results if result is True)
+            failed = len(results) - generated
+            
+            # Failures handled inside a task were already printed; surface
+            # anything that escaped one
+            for result in results:
+                if isinstance(result, BaseException):
+                    print(f"  ❌ Unexpected error: {result!r}")
+            
+            print()
+    finally:
+        if http_client is not None:
+            await http_client.aclose()
+    
     # Summary
     print("=" * 60)
     if DRY_RUN:
@@ -380,9 +475,9 @@ def main():
         print("GENERATION COMPLETE")
         print(f"  ✅ Generated: {generated}")
         print(f"  ❌ Failed: {failed}")
-        print(f"  📁 Output: {assets_dir}")
+        print(f"  📁 Output: {_ASSETS_DIR}")
     print("=" * 60)
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -5,9 +5,23 @@ Run this first to verify voice quality before generating all files.
 """
 
 import os
+import sys
 from pathlib import Path
 from dotenv import load_dotenv
 
+# Add project root to path for absolute imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.tts_text import get_bangla_text
+
+try:
+    from elevenlabs import VoiceSettings, save
+    from elevenlabs.client import ElevenLabs
+except ImportError:
+    VoiceSettings = None
+    save = None
+    ElevenLabs = None
+
 load_dotenv()
 
 # =============================================================================
@@ -28,53 +42,6 @@ TEST_HOUR = 16  # 4 PM
 TEST_MINUTE = 0
 
 
-# =============================================================================
-# BANGLA TEXT GENERATION (same logic as main script)
-# =============================================================================
-
-BANGLA_HOURS = {
-    1: "একটা", 2: "দুইটা", 3: "তিনটা", 4: "চারটা", 5: "পাঁচটা", 6: "ছয়টা",
-    7: "সাতটা", 8: "আটটা", 9: "নয়টা", 10: "দশটা", 11: "এগারোটা", 12: "বারোটা",
-}
-
-BANGLA_MINUTES = {
-    0: "",
-    15: "বেজে পনেরো মিনিট",
-    30: "বেজে ত্রিশ মিনিট",
-    45: "বেজে পঁয়তাল্লিশ মিনিট",
-}
-
-
-def get_bangla_time_of_day(hour_24: int) -> str:
-    if 4 <= hour_24 <= 5:
-        return "ভোর"
-    elif 6 <= hour_24 <= 11:
-        return "সকাল"
-    elif 12 <= hour_24 <= 15:
-        return "দুপুর"
-    elif 16 <= hour_24 <= 17:
-        return "বিকেল"
-    elif 18 <= hour_24 <= 19:
-        return "সন্ধ্যা"
-    else:
-        return "রাত"
-
-
-def get_bangla_text(hour_24: int, minute: int) -> str:
-    hour_12 = hour_24 % 12
-    if hour_12 == 0:
-        hour_12 = 12
-    
-    time_of_day = get_bangla_time_of_day(hour_24)
-    hour_word = BANGLA_HOURS[hour_12]
-    
-    if minute == 0:
-        return f"এখন সময় {time_of_day} {hour_word}"
-    else:
-        minute_phrase = BANGLA_MINUTES[minute]
-        return f"এখন সময় {time_of_day} {hour_word} {minute_phrase}"
-
-
 def main():
     print("=" * 60)
     print("VoiceClock - Bangla Voice Test")
@@ -87,11 +54,8 @@ def main():
         print("❌ Error: ELEVENLABS_API_KEY not found in .env")
         return
     
-    # Import ElevenLabs
-    try:
-        from elevenlabs.client import ElevenLabs
-        from elevenlabs import VoiceSettings, save
-    except ImportError:
+    # Check ElevenLabs
+    if ElevenLabs is None:
         print("❌ Error: elevenlabs package not installed")
         return
     
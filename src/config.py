@@ -6,8 +6,17 @@ Handles loading, saving, and providing defaults for user preferences.
 
 import json
 import logging
+import os
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
+
+from gi.repository import GLib
+
+# Optional: orjson serializes much faster than the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +30,9 @@ class ConfigManager:
         "muted": False
     }
     
+    # Delay before auto-saved changes are written, coalescing rapid updates
+    SAVE_DELAY_MS = 200
+    
     def __init__(self, config_path: Path):
         """
         Initialize the ConfigManager.
@@ -30,6 +42,11 @@ class ConfigManager:
         """
         self.config_path = Path(config_path)
         self._settings: Dict[str, Any] = {}
+        
+        # Pending auto-save state
+        self._dirty = False
+        self._save_source_id: Optional[int] = None
+        
         self.load()
     
     def load(self) -> Dict[str, Any]:
@@ -67,6 +84,9 @@ class ConfigManager:
         """
         Save settings to JSON file.
         
+        The file is written to a temporary path and renamed into place,
+        so a crash mid-write never leaves a truncated config behind.
+        
         Args:
             settings: Optional settings dict. If None, saves current settings.
             
@@ -80,9 +100,16 @@ class ConfigManager:
             # Ensure parent directory exists
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(self._settings, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                data = orjson.dumps(self._settings, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(self._settings, indent=2, ensure_ascii=False).encode('utf-8')
+            
+            tmp_path = self.config_path.with_suffix(".json.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, self.config_path)
             
+            self._dirty = False
             logger.info(f"Config saved to {self.config_path}")
             return True
             
@@ -110,11 +137,31 @@ class ConfigManager:
         Args:
             key: The setting key to update.
             value: The new value.
-            auto_save: If True, immediately persist to disk.
+            auto_save: If True, persist to disk shortly after (debounced).
         """
         self._settings[key] = value
         if auto_save:
+            self._dirty = True
+            if self._save_source_id is None:
+                self._save_source_id = GLib.timeout_add(self.SAVE_DELAY_MS, self._flush)
+    
+    def _flush(self) -> bool:
+        """
+        Write pending changes to disk (GLib timeout callback).
+        
+        Returns:
+            GLib.SOURCE_REMOVE to run only once.
+        """
+        self._save_source_id = None
+        if self._dirty:
             self.save()
+        return GLib.SOURCE_REMOVE
+    
+    def flush(self) -> None:
+        """Immediately write any pending auto-saved changes (e.g., on quit)."""
+        if self._save_source_id is not None:
+            GLib.source_remove(self._save_source_id)
+        self._flush()
     
     @property
     def settings(self) -> Dict[str, Any]:
@@ -15,7 +15,7 @@ from pathlib import Path
 
 import gi
 gi.require_version('Gtk', '3.0')
-from gi.repository import Gtk, GLib
+from gi.repository import Gtk
 
 # Add src to path for absolute imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -54,6 +54,7 @@ class VoiceClockApp:
         self.config = ConfigManager(self.config_path)
         self.player = AudioPlayer()
         self.announcer = TimeAnnouncer(self.config, self.player, self.assets_dir)
+        self.player.prewarm()
         
         # Reference to current settings window (if open)
         self._settings_window = None
@@ -62,37 +63,16 @@ class VoiceClockApp:
         self.tray = SystemTray(
             config=self.config,
             on_settings=self._show_settings,
-            on_quit=self._quit
+            on_quit=self._quit,
+            on_mute_changed=self._on_mute_changed
         )
         
-        # Start the scheduler (event-driven, 60-second intervals)
-        # GLib.timeout_add_seconds integrates with GTK main loop - zero CPU when idle
-        self._scheduler_id = GLib.timeout_add_seconds(60, self._on_scheduler_tick)
-        
-        # Also check immediately on startup (in case we launch at XX:00)
-        GLib.timeout_add_seconds(1, self._initial_check)
+        # Start announcing: checks the current minute, then arms a one-shot
+        # timer for each upcoming boundary so the CPU only wakes when needed
+        self.announcer.start()
         
         logger.info("VoiceClock initialized successfully")
     
-    def _on_scheduler_tick(self) -> bool:
-        """
-        Called every 60 seconds by GLib.timeout.
-        
-        Returns:
-            True to keep the timeout running.
-        """
-        return self.announcer.check_and_announce()
-    
-    def _initial_check(self) -> bool:
-        """
-        Perform initial time check shortly after startup.
-        
-        Returns:
-            False to run only once.
-        """
-        self.announcer.check_and_announce()
-        return False  # Run only once
-    
     def _show_settings(self) -> None:
         """Open the settings window."""
         # Avoid opening multiple settings windows
@@ -111,8 +91,24 @@ class VoiceClockApp:
         """Handle settings saved event."""
         # Sync tray mute state
         self.tray.update_mute_state()
-        # Reset debounce so new interval takes effect
-        self.announcer.reset_debounce()
+        # Pick up the new settings and audio files for the (possibly new)
+        # language, then re-arm the timer so the new interval takes effect
+        self.announcer.reload_from_config()
+        self.announcer.refresh_audio_index()
+        self.announcer.reschedule()
+    
+    def _on_mute_changed(self, muted: bool) -> None:
+        """
+        Handle mute toggled from the tray.
+        
+        Args:
+            muted: The new mute state.
+        """
+        # Muting removes the announcer's timer entirely; unmuting re-arms it
+        if muted:
+            self.announcer.pause()
+        else:
+            self.announcer.resume()
     
     def _on_settings_closed(self, window) -> None:
         """Handle settings window closed."""
@@ -123,8 +119,10 @@ class VoiceClockApp:
         logger.info("Quitting VoiceClock...")
         
         # Remove scheduler
-        if hasattr(self, '_scheduler_id'):
-            GLib.source_remove(self._scheduler_id)
+        self.announcer.stop()
+        
+        # Write any pending settings changes
+        self.config.flush()
         
         # Cleanup player
         self.player.cleanup()
@@ -6,6 +6,7 @@ without subprocess overhead.
 """
 
 import logging
+import os
 from pathlib import Path
 
 import gi
@@ -34,24 +35,28 @@ class AudioPlayer:
         
         logger.info("AudioPlayer initialized with GStreamer playbin")
     
-    def play(self, file_path: Path) -> bool:
+    def play(self, file_path: Path, check_exists: bool = True) -> bool:
         """
         Play an audio file.
         
         Args:
             file_path: Path to the audio file (.ogg or .mp3).
+            check_exists: Verify the file exists first. Callers resolving
+                paths from TimeAnnouncer's audio index can skip the stat().
             
         Returns:
             True if playback started successfully.
         """
         file_path = Path(file_path)
         
-        if not file_path.exists():
+        if check_exists and not file_path.exists():
             logger.warning(f"Audio file not found: {file_path}")
             return False
         
-        # Stop any current playback
+        # Stop any current playback; wait for READY to commit, since
+        # playbin only accepts a new URI in READY or NULL
         self.stop()
+        self._player.get_state(Gst.CLOCK_TIME_NONE)
         
         # Set the URI and start playing
         uri = file_path.absolute().as_uri()
@@ -66,16 +71,57 @@ class AudioPlayer:
         logger.info(f"Playing: {file_path.name}")
         return True
     
+    def prewarm(self) -> None:
+        """
+        Bring the pipeline to READY ahead of the first announcement.
+        
+        Moves the NULL -> READY setup cost to startup, so the first play()
+        at a boundary only sets the URI and starts PLAYING.
+        """
+        self._player.set_state(Gst.State.READY)
+        self._player.get_state(Gst.CLOCK_TIME_NONE)
+    
+    def prefetch(self, file_path: Path) -> None:
+        """
+        Hint the kernel to load an audio file into the page cache.
+        
+        Called ahead of the next announcement so playback starts from
+        memory instead of disk. No-op where posix_fadvise is unavailable.
+        
+        Args:
+            file_path: Path to the audio file that will be played next.
+        """
+        if not hasattr(os, "posix_fadvise"):
+            return
+        
+        try:
+            fd = os.open(file_path, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            finally:
+                os.close(fd)
+        except OSError as e:
+            logger.debug(f"Could not prefetch {file_path}: {e}")
+    
     def stop(self) -> None:
-        """Stop current playback."""
-        self._player.set_state(Gst.State.NULL)
+        """
+        Stop current playback.
+        
+        Drops to READY rather than NULL so the audio sink keeps its
+        device open for the next announcement (decoders are torn down
+        on PAUSED -> READY either way).
+        """
+        self._player.set_state(Gst.State.READY)
     
     def _on_error(self, bus, message) -> None:
         """Handle GStreamer error messages."""
         err, debug = message.parse_error()
         logger.error(f"GStreamer error: {err.message}")
         logger.debug(f"Debug info: {debug}")
-        self.stop()
+        
+        # Reset fully: a sink left in READY may hold a dead connection
+        # (e.g. after the sound server restarted), so let play() reopen it
+        self._player.set_state(Gst.State.NULL)
     
     def _on_eos(self, bus, message) -> None:
         """Handle end-of-stream (playback finished)."""
@@ -84,5 +130,5 @@ class AudioPlayer:
     
     def cleanup(self) -> None:
         """Clean up GStreamer resources."""
-        self.stop()
+        self._player.set_state(Gst.State.NULL)
         self._player = None
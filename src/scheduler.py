@@ -1,29 +1,48 @@
 """
 TimeAnnouncer - Core logic engine for scheduled time announcements.
 
-Handles time-checking logic with debounce protection to prevent
-duplicate announcements within the same minute.
+Schedules a single timer for each upcoming interval boundary instead of
+polling, so the process only wakes when there is something to announce.
 """
 
 import logging
+import math
+import os
+import re
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
+
+from gi.repository import GLib
 
 from .config import ConfigManager
 from .player import AudioPlayer
 
 logger = logging.getLogger(__name__)
 
+# Audio filenames: HH_MM.mp3 or HH_MM.ogg (24-hour time)
+_AUDIO_RE = re.compile(r'^(\d{2})_(\d{2})\.(ogg|mp3)$')
+
 
 class TimeAnnouncer:
     """
     Core time announcement engine.
     
-    Designed to be called every 60 seconds via GLib.timeout_add_seconds.
-    Uses debounce logic to prevent double-plays within the same minute.
+    Arms a one-shot GLib timer for the next interval boundary, announces
+    when it fires, then re-arms itself. Because each boundary is scheduled
+    exactly once, no debounce tracking is needed.
+    
+    Timers are added with GLib.timeout_add_seconds, which lets GLib wake
+    for them together with other second-granularity sources. Other periodic
+    sources in the app should use timeout_add_seconds too, so they can be
+    coalesced with this one.
     """
     
+    # Longest single timer (seconds), so suspend/resume and clock changes
+    # are noticed within a few minutes instead of up to a full interval
+    MAX_TIMER_DELAY = 300
+    
     def __init__(self, config: ConfigManager, player: AudioPlayer, assets_dir: Path):
         """
         Initialize the TimeAnnouncer.
@@ -37,57 +56,217 @@ class TimeAnnouncer:
         self.player = player
         self.assets_dir = Path(assets_dir)
         
-        # Debounce tracker: stores the last minute we played audio
-        self._last_played_minute: int = -1
-        self._last_played_hour: int = -1
+        # Settings used on every tick, cached as plain attributes
+        self._muted: bool = False
+        self._interval: int = 60
+        self._language: str = "en"
+        self.reload_from_config()
         
-        logger.info("TimeAnnouncer initialized")
+        # (language, hour, minute) -> audio file, so lookups need no stat()
+        self._audio_index: Dict[Tuple[str, int, int], Path] = {}
+        self.refresh_audio_index()
+        
+        # Pending boundary timer
+        self._tick_source_id: Optional[int] = None
+        self._next_tick: int = 0  # epoch seconds
+        
+        logger.debug("TimeAnnouncer initialized")
+    
+    def reload_from_config(self) -> None:
+        """Re-read the cached settings (call after the config changes)."""
+        self._muted = bool(self.config.get("muted", False))
+        self._interval = self.config.get("interval", 60)
+        self._language = self.config.get("language", "en")
+    
+    def start(self) -> None:
+        """
+        Announce now if we launched on a boundary, then start scheduling.
+        
+        The check and the first timer share one timestamp, so a launch
+        right before a boundary can't announce the same slot twice.
+        """
+        # While muted no timer exists at all; resume() arms it
+        if self._muted:
+            return
+        
+        t = time.time()
+        st = time.localtime(t)
+        self._announce_if_due(st.tm_hour, st.tm_min)
+        self._schedule_next(t)
+    
+    def stop(self) -> None:
+        """Cancel the pending boundary timer."""
+        if self._tick_source_id is not None:
+            GLib.source_remove(self._tick_source_id)
+            self._tick_source_id = None
+    
+    def reschedule(self) -> None:
+        """Re-arm the timer, e.g. after the interval setting changed."""
+        self.stop()
+        if not self._muted:
+            self._schedule_next(time.time())
+    
+    def pause(self) -> None:
+        """Mute announcements by removing the timer (no wakeups while muted)."""
+        self._muted = True
+        self.stop()
+    
+    def resume(self) -> None:
+        """Unmute announcements and arm the timer for the next boundary."""
+        self._muted = False
+        if self._tick_source_id is None:
+            self._schedule_next(time.time())
     
     def check_and_announce(self) -> bool:
         """
-        Check current time and play announcement if interval matches.
+        Announce the current time if it falls on an interval boundary.
         
-        This method is designed to be called by GLib.timeout_add_seconds.
-        Returns True to keep the timeout running.
+        Kept for compatibility with callers that poll; scheduling is
+        handled internally by start().
         
         Returns:
-            Always True to keep the GLib timeout active.
+            GLib.SOURCE_CONTINUE (keeps a polling GLib timeout active).
         """
-        # Skip if muted
-        if self.config.get("muted"):
-            return True
+        if not self._muted:
+            st = time.localtime()
+            self._announce_if_due(st.tm_hour, st.tm_min)
+        return GLib.SOURCE_CONTINUE
+    
+    def _announce_if_due(self, hour: int, minute: int) -> None:
+        """
+        Play the announcement for a time if it matches the interval.
         
-        now = datetime.now()
-        current_hour = now.hour
-        current_minute = now.minute
-        interval = self.config.get("interval", 60)
+        Mute is not checked here: while muted, no timer is scheduled.
         
-        # Check if current minute matches the interval
+        Args:
+            hour: Hour in 24-hour format (0-23).
+            minute: Minute (0-59).
+        """
         # interval=15 → trigger at :00, :15, :30, :45
         # interval=30 → trigger at :00, :30
         # interval=60 → trigger at :00
-        if current_minute % interval == 0:
-            # Debounce: prevent double-play within the same hour:minute
-            if not self._already_played(current_hour, current_minute):
-                self._last_played_hour = current_hour
-                self._last_played_minute = current_minute
-                self._play_time_audio(current_hour, current_minute)
+        if minute % self._interval == 0:
+            self._play_time_audio(hour, minute)
+    
+    def _schedule_next(self, t: float) -> None:
+        """
+        Arm a one-shot timer for the next interval boundary (e.g. XX:15:00).
+        
+        Args:
+            t: Current time as seconds since the epoch.
+        """
+        st = time.localtime(t)
+        
+        # Intervals divide the hour evenly, so round up to the next multiple
+        minutes_ahead = self._interval - (st.tm_min % self._interval)
+        self._next_tick = int(t) - st.tm_sec + minutes_ahead * 60
+        self._arm_timer()
+    
+    def _arm_timer(self) -> None:
+        """
+        Start the GLib timer for the remaining time until _next_tick.
+        
+        The delay is capped at MAX_TIMER_DELAY: GLib timers use the
+        monotonic clock, which stops during suspend and ignores wall-clock
+        steps, so a long timer could fire well past its boundary. Waking
+        periodically re-syncs with the wall clock via _on_tick.
+        
+        On the last hop before the boundary the next clip is prefetched,
+        so it is warm in the page cache at most MAX_TIMER_DELAY early.
+        """
+        remaining = math.ceil(self._next_tick - time.time())
+        if remaining <= self.MAX_TIMER_DELAY:
+            next_st = time.localtime(self._next_tick)
+            next_path = self.get_audio_path(next_st.tm_hour, next_st.tm_min)
+            if next_path is not None:
+                self.player.prefetch(next_path)
+        
+        delay = min(max(1, remaining), self.MAX_TIMER_DELAY)
+        self._tick_source_id = GLib.timeout_add_seconds(delay, self._on_tick)
+        logger.debug("Next announcement in %ds", delay)
+    
+    def _on_tick(self) -> bool:
+        """
+        Called by GLib at the scheduled boundary.
+        
+        Returns:
+            GLib.SOURCE_REMOVE; the next timer is added afresh.
+        """
+        self._tick_source_id = None
+        t = time.time()
+        
+        # Woke before the boundary: either a capped intermediate wakeup or
+        # the wall clock was adjusted; re-arm for the remainder
+        if t < self._next_tick:
+            self._arm_timer()
+            return GLib.SOURCE_REMOVE
         
-        return True  # Keep timeout running
+        # Only announce if we're still within the scheduled minute
+        # (e.g. not when waking from suspend long after the boundary)
+        if t - self._next_tick < 60:
+            st = time.localtime(t)
+            self._announce_if_due(st.tm_hour, st.tm_min)
+        
+        self._schedule_next(t)
+        return GLib.SOURCE_REMOVE
     
-    def _already_played(self, hour: int, minute: int) -> bool:
+    def refresh_audio_index(self) -> None:
         """
-        Check if we already played for this specific hour:minute.
+        Scan assets/audio/<language>/ once and index the available files.
+        
+        Keys use 24-hour time so lookups need no conversion. A language
+        recorded as a 12-hour set (01-12, as listed by file_namer.py) is
+        indexed under both the AM and PM hour. .mp3 files take precedence
+        over .ogg files for the same time.
+        """
+        index: Dict[Tuple[str, int, int], Path] = {}
+        audio_dir = self.assets_dir / "audio"
+        
+        try:
+            with os.scandir(audio_dir) as lang_dirs:
+                for lang_entry in lang_dirs:
+                    # d_type from the directory listing; no extra stat()
+                    if not lang_entry.is_dir(follow_symlinks=False):
+                        continue
+                    
+                    # (hour, minute) as named on disk -> audio file
+                    found: Dict[Tuple[int, int], Path] = {}
+                    with os.scandir(lang_entry.path) as files:
+                        for entry in files:
+                            match = _AUDIO_RE.match(entry.name)
+                            if match is None:
+                                continue
+                            hour, minute, ext = match.groups()
+                            slot = (int(hour), int(minute))
+                            if ext == "mp3" or slot not in found:
+                                found[slot] = Path(entry.path)
+                    
+                    language = lang_entry.name
+                    twelve_hour = all(1 <= hour <= 12 for hour, _ in found)
+                    for (hour, minute), path in found.items():
+                        if twelve_hour:
+                            index[(language, hour % 12, minute)] = path
+                            index[(language, hour % 12 + 12, minute)] = path
+                        else:
+                            index[(language, hour, minute)] = path
+        except OSError as e:
+            logger.warning(f"Failed to scan audio directory {audio_dir}: {e}")
+        
+        self._audio_index = index
+        logger.info(f"Audio index built: {len(index)} entries")
+    
+    def get_audio_path(self, hour: int, minute: int) -> Optional[Path]:
+        """
+        Resolve the audio file for a time in the current language.
         
         Args:
-            hour: Current hour (0-23).
-            minute: Current minute (0-59).
+            hour: Hour in 24-hour format (0-23).
+            minute: Minute (0-59).
             
         Returns:
-            True if already played for this time.
+            Path to the .mp3 (or .ogg fallback) file, or None if missing.
         """
-        return (self._last_played_hour == hour and 
-                self._last_played_minute == minute)
+        return self._audio_index.get((self._language, hour, minute))
     
     def _play_time_audio(self, hour: int, minute: int) -> None:
         """
@@ -97,34 +276,20 @@ class TimeAnnouncer:
             hour: Hour in 24-hour format (0-23).
             minute: Minute (0-59).
         """
-        language = self.config.get("language", "en")
-        
-        # Use 24-hour format for filename (matching generated files)
-        filename = f"{hour:02d}_{minute:02d}.mp3"
-        audio_path = self.assets_dir / "audio" / language / filename
+        audio_path = self.get_audio_path(hour, minute)
         
-        if audio_path.exists():
-            logger.info(f"Announcing time: {hour:02d}:{minute:02d} ({language})")
-            self.player.play(audio_path)
+        if audio_path is not None:
+            logger.info("Announcing time: %02d:%02d (%s)", hour, minute, self._language)
+            # Paths from the index are known to exist
+            self.player.play(audio_path, check_exists=False)
         else:
-            # Try .ogg fallback
-            audio_path_ogg = audio_path.with_suffix('.ogg')
-            if audio_path_ogg.exists():
-                logger.info(f"Announcing time: {hour:02d}:{minute:02d} ({language}) [ogg]")
-                self.player.play(audio_path_ogg)
-            else:
-                logger.warning(f"Audio file not found: {audio_path} or {audio_path_ogg}")
+            logger.warning(f"Audio file not found for {hour:02d}:{minute:02d} ({self._language})")
     
     def force_announce(self) -> None:
         """
         Force an immediate time announcement (for testing).
         
-        Bypasses interval and debounce checks.
+        Bypasses the interval and mute checks.
         """
         now = datetime.now()
         self._play_time_audio(now.hour, now.minute)
-    
-    def reset_debounce(self) -> None:
-        """Reset the debounce tracker."""
-        self._last_played_minute = -1
-        self._last_played_hour = -1
@@ -5,7 +5,10 @@ Provides a clean UI for configuring language and interval preferences.
 Window is destroyed on close to minimize RAM usage.
 """
 
+import functools
 import logging
+from types import ModuleType
+from typing import Optional
 
 import gi
 gi.require_version('Gtk', '3.0')
@@ -16,6 +19,26 @@ from .config import ConfigManager
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _load_notify() -> Optional[ModuleType]:
+    """
+    Load and initialize libnotify on the first notification.
+    
+    libnotify sends notifications in-process; callers fall back to
+    notify-send when it is unavailable.
+    
+    Returns:
+        The gi.repository.Notify module, or None if unavailable.
+    """
+    try:
+        gi.require_version('Notify', '0.7')
+        from gi.repository import Notify
+        Notify.init("VoiceClock")
+        return Notify
+    except (ValueError, ImportError):
+        return None
+
+
 class SettingsWindow(Gtk.Window):
     """
     Settings dialog window.
@@ -35,6 +58,13 @@ class SettingsWindow(Gtk.Window):
         (60, "Every hour")
     ]
     
+    # Reused across windows so rapid saves update one notification
+    _notification = None
+    
+    # Combo box models (id, label), shared by every window and built on first open
+    _lang_model: Gtk.ListStore = None
+    _interval_model: Gtk.ListStore = None
+    
     def __init__(self, config: ConfigManager, on_saved: callable = None):
         """
         Initialize the settings window.
@@ -56,12 +86,50 @@ class SettingsWindow(Gtk.Window):
         
         # Destroy on close (not hide) for RAM efficiency
         self.connect("delete-event", self._on_delete)
+        self.connect("destroy", self._on_destroy)
         
         # Build UI
         self._build_ui()
         
         logger.info("SettingsWindow opened")
     
+    @classmethod
+    def _get_models(cls) -> tuple:
+        """
+        Return the shared combo models, building them on first use.
+        
+        Returns:
+            Tuple of (language model, interval model).
+        """
+        if cls._lang_model is None:
+            cls._lang_model = Gtk.ListStore(str, str)
+            for code, name in cls.LANGUAGES:
+                cls._lang_model.append([code, name])
+            
+            cls._interval_model = Gtk.ListStore(str, str)
+            for minutes, label in cls.INTERVALS:
+                cls._interval_model.append([str(minutes), label])
+        
+        return cls._lang_model, cls._interval_model
+    
+    @staticmethod
+    def _make_combo(model: Gtk.ListStore) -> Gtk.ComboBox:
+        """
+        Create a combo box showing a shared (id, label) model.
+        
+        Args:
+            model: ListStore with id in column 0 and label in column 1.
+            
+        Returns:
+            The configured Gtk.ComboBox.
+        """
+        combo = Gtk.ComboBox.new_with_model(model)
+        combo.set_id_column(0)
+        renderer = Gtk.CellRendererText()
+        combo.pack_start(renderer, True)
+        combo.add_attribute(renderer, "text", 1)
+        return combo
+    
     def _build_ui(self) -> None:
         """Construct the UI components."""
         # Main vertical box
@@ -69,9 +137,15 @@ class SettingsWindow(Gtk.Window):
         self.add(vbox)
         
         # --- Header ---
-        header = Gtk.Label()
-        header.set_markup("<b>🕐 VoiceClock Settings</b>")
+        header = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
         header.set_halign(Gtk.Align.START)
+        header.pack_start(
+            Gtk.Image.new_from_icon_name("preferences-system-time", Gtk.IconSize.MENU),
+            False, False, 0
+        )
+        header_label = Gtk.Label()
+        header_label.set_markup("<b>VoiceClock Settings</b>")
+        header.pack_start(header_label, False, False, 0)
         vbox.pack_start(header, False, False, 0)
         
         # --- Language Selection ---
@@ -81,14 +155,12 @@ class SettingsWindow(Gtk.Window):
         lang_label.set_size_request(100, -1)
         lang_box.pack_start(lang_label, False, False, 0)
         
-        self.lang_combo = Gtk.ComboBoxText()
+        lang_model, interval_model = self._get_models()
+        
+        self.lang_combo = self._make_combo(lang_model)
         current_lang = self.config.get("language", "en")
-        active_index = 0
-        for i, (code, name) in enumerate(self.LANGUAGES):
-            self.lang_combo.append(code, name)
-            if code == current_lang:
-                active_index = i
-        self.lang_combo.set_active(active_index)
+        if not self.lang_combo.set_active_id(current_lang):
+            self.lang_combo.set_active(0)
         lang_box.pack_start(self.lang_combo, True, True, 0)
         
         vbox.pack_start(lang_box, False, False, 0)
@@ -100,14 +172,10 @@ class SettingsWindow(Gtk.Window):
         interval_label.set_size_request(100, -1)
         interval_box.pack_start(interval_label, False, False, 0)
         
-        self.interval_combo = Gtk.ComboBoxText()
+        self.interval_combo = self._make_combo(interval_model)
         current_interval = self.config.get("interval", 60)
-        active_index = 2  # Default to 60 min
-        for i, (minutes, label) in enumerate(self.INTERVALS):
-            self.interval_combo.append(str(minutes), label)
-            if minutes == current_interval:
-                active_index = i
-        self.interval_combo.set_active(active_index)
+        if not self.interval_combo.set_active_id(str(current_interval)):
+            self.interval_combo.set_active(2)  # Default to 60 min
         interval_box.pack_start(self.interval_combo, True, True, 0)
         
         vbox.pack_start(interval_box, False, False, 0)
@@ -120,7 +188,7 @@ class SettingsWindow(Gtk.Window):
         button_box.set_halign(Gtk.Align.END)
         
         cancel_btn = Gtk.Button(label="Cancel")
-        cancel_btn.connect("clicked", lambda _: self.destroy())
+        cancel_btn.connect("clicked", self._on_cancel_clicked)
         button_box.pack_start(cancel_btn, False, False, 0)
         
         save_btn = Gtk.Button(label="Save")
@@ -130,33 +198,46 @@ class SettingsWindow(Gtk.Window):
         
         vbox.pack_start(button_box, False, False, 0)
     
+    def _on_cancel_clicked(self, _btn: Gtk.Button) -> None:
+        """Close the window without saving."""
+        self.destroy()
+    
     def _on_save_clicked(self, button: Gtk.Button) -> None:
         """
         Handle save button click.
         
-        Saves settings to config and shows notification.
+        Saves changed settings to config and shows notification.
+        Skips the disk write and callback if nothing changed.
         """
         # Get selected values
         lang_id = self.lang_combo.get_active_id()
         interval_id = self.interval_combo.get_active_id()
         
-        if lang_id:
+        # Only write values that actually changed
+        changed = False
+        
+        if lang_id and lang_id != self.config.get("language"):
             self.config.set("language", lang_id, auto_save=False)
+            changed = True
         
-        if interval_id:
+        if interval_id and int(interval_id) != self.config.get("interval"):
             self.config.set("interval", int(interval_id), auto_save=False)
+            changed = True
         
-        # Save to disk
-        self.config.save()
-        
-        logger.info(f"Settings saved: language={lang_id}, interval={interval_id}")
-        
-        # Show notification
-        self._show_notification("Settings saved successfully!")
-        
-        # Callback
-        if self._on_saved:
-            self._on_saved()
+        if changed:
+            # Save to disk
+            self.config.save()
+            
+            logger.info(f"Settings saved: language={lang_id}, interval={interval_id}")
+            
+            # Show notification
+            self._show_notification("Settings saved successfully!")
+            
+            # Callback
+            if self._on_saved:
+                self._on_saved()
+        else:
+            logger.info("Settings unchanged, nothing to save")
         
         # Close window
         self.destroy()
@@ -168,6 +249,22 @@ class SettingsWindow(Gtk.Window):
         Args:
             message: The notification message.
         """
+        Notify = _load_notify()
+        if Notify is not None:
+            try:
+                cls = type(self)
+                if cls._notification is None:
+                    cls._notification = Notify.Notification.new(
+                        "VoiceClock", message, "preferences-system-time"
+                    )
+                    cls._notification.set_timeout(2000)
+                else:
+                    cls._notification.update("VoiceClock", message, "preferences-system-time")
+                cls._notification.show()
+                return
+            except GLib.Error as e:
+                logger.debug(f"libnotify failed ({e}), falling back to notify-send")
+        
         try:
             import subprocess
             subprocess.Popen([
@@ -184,3 +281,8 @@ class SettingsWindow(Gtk.Window):
         """Handle window close."""
         logger.info("SettingsWindow closed")
         return False  # Allow destruction
+    
+    def _on_destroy(self, widget) -> None:
+        """Detach the shared models so they outlive this window's combos."""
+        self.lang_combo.set_model(None)
+        self.interval_combo.set_model(None)
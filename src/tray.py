@@ -5,44 +5,78 @@ Provides a persistent tray icon with menu for quick access to settings,
 mute toggle, and quit functionality.
 """
 
+import functools
+import importlib
 import logging
+from types import ModuleType
+from typing import TYPE_CHECKING, Optional, Tuple
 
 import gi
-gi.require_version('Gtk', '3.0')
 
-# Try AyatanaAppIndicator3 first (modern Ubuntu 22.04+), fall back to AppIndicator3
-try:
-    gi.require_version('AyatanaAppIndicator3', '0.1')
-    from gi.repository import AyatanaAppIndicator3 as AppIndicator
-    INDICATOR_TYPE = "Ayatana"
-except (ValueError, ImportError):
-    try:
-        gi.require_version('AppIndicator3', '0.1')
-        from gi.repository import AppIndicator3 as AppIndicator
-        INDICATOR_TYPE = "AppIndicator3"
-    except (ValueError, ImportError):
-        AppIndicator = None
-        INDICATOR_TYPE = None
-
-from gi.repository import Gtk
+if TYPE_CHECKING:
+    from gi.repository import Gtk
 
 from .config import ConfigManager
 
 logger = logging.getLogger(__name__)
 
+# Indicator libraries in order of preference: (GI namespace, label)
+_INDICATOR_CANDIDATES = (
+    ("AyatanaAppIndicator3", "Ayatana"),        # Modern Ubuntu 22.04+
+    ("AppIndicator3", "AppIndicator3"),         # Legacy fallback
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_indicator() -> Tuple[Optional[ModuleType], Optional[str]]:
+    """
+    Find the best available AppIndicator library (resolved once).
+    
+    Queries the installed typelib versions first, so a missing library
+    is skipped without a failed require_version/import.
+    
+    Returns:
+        Tuple of (indicator module, label), or (None, None) if unavailable.
+    """
+    repository = gi.Repository.get_default()
+    for namespace, label in _INDICATOR_CANDIDATES:
+        if "0.1" not in repository.enumerate_versions(namespace):
+            continue
+        try:
+            gi.require_version(namespace, '0.1')
+            return importlib.import_module(f"gi.repository.{namespace}"), label
+        except (ValueError, ImportError):
+            continue
+    return None, None
+
+
+@functools.lru_cache(maxsize=1)
+def _load_gtk() -> ModuleType:
+    """
+    Import Gtk 3 on first use rather than when this module is imported.
+    
+    Returns:
+        The gi.repository.Gtk module.
+    """
+    gi.require_version('Gtk', '3.0')
+    from gi.repository import Gtk
+    return Gtk
+
 
 class SystemTray:
     """
     System tray icon with dropdown menu.
     
     Uses AyatanaAppIndicator3 on modern Ubuntu, with fallback to AppIndicator3.
+    The indicator typelib is only loaded when the first tray is created.
     """
     
     def __init__(
         self, 
         config: ConfigManager, 
         on_settings: callable, 
-        on_quit: callable
+        on_quit: callable,
+        on_mute_changed: callable = None
     ):
         """
         Initialize the system tray.
@@ -51,10 +85,18 @@ class SystemTray:
             config: ConfigManager instance for mute state.
             on_settings: Callback when "Settings" is clicked.
             on_quit: Callback when "Quit" is clicked.
+            on_mute_changed: Optional callback after "Mute" is toggled,
+                called with the new muted state.
         """
         self.config = config
         self._on_settings = on_settings
         self._on_quit = on_quit
+        self._on_mute_changed = on_mute_changed
+        
+        # Created once by _build_menu (stays None if the tray is disabled)
+        self.item_mute: Optional["Gtk.CheckMenuItem"] = None
+        
+        AppIndicator, indicator_type = _resolve_indicator()
         
         if AppIndicator is None:
             logger.error("AppIndicator not available - tray icon disabled")
@@ -73,27 +115,52 @@ class SystemTray:
         # Build and attach menu
         self.indicator.set_menu(self._build_menu())
         
-        logger.info(f"SystemTray initialized using {INDICATOR_TYPE}")
+        logger.info(f"SystemTray initialized using {indicator_type}")
     
-    def _build_menu(self) -> Gtk.Menu:
+    @staticmethod
+    def _image_item(icon_name: str, label: str) -> "Gtk.ImageMenuItem":
+        """
+        Create a menu item with a themed icon and a text label.
+        
+        Themed icons come from GTK's icon cache, unlike color emoji glyphs
+        which need font fallback and shaping on every redraw. The indicator
+        exports the menu over DBus (libdbusmenu-gtk), which only picks up
+        icons from an ImageMenuItem's image, so the deprecated widget is
+        used deliberately.
+        
+        Args:
+            icon_name: Icon theme name.
+            label: Text label.
+            
+        Returns:
+            The new menu item.
+        """
+        Gtk = _load_gtk()
+        item = Gtk.ImageMenuItem(label=label)
+        item.set_image(Gtk.Image.new_from_icon_name(icon_name, Gtk.IconSize.MENU))
+        item.set_always_show_image(True)
+        return item
+    
+    def _build_menu(self) -> "Gtk.Menu":
         """
         Build the tray dropdown menu.
         
         Returns:
             The constructed Gtk.Menu.
         """
+        Gtk = _load_gtk()
         menu = Gtk.Menu()
         
         # Settings item
-        item_settings = Gtk.MenuItem(label="⚙️ Settings")
-        item_settings.connect("activate", lambda _: self._on_settings())
+        item_settings = self._image_item("preferences-system", "Settings")
+        item_settings.connect("activate", self._on_settings_activate)
         menu.append(item_settings)
         
         # Separator
         menu.append(Gtk.SeparatorMenuItem())
         
-        # Mute toggle (checkable)
-        self.item_mute = Gtk.CheckMenuItem(label="🔇 Mute")
+        # Mute toggle (checkable; the check mark stands in for an icon)
+        self.item_mute = Gtk.CheckMenuItem(label="Mute")
         self.item_mute.set_active(self.config.get("muted", False))
         self.item_mute.connect("toggled", self._on_mute_toggled)
         menu.append(self.item_mute)
@@ -102,14 +169,22 @@ class SystemTray:
         menu.append(Gtk.SeparatorMenuItem())
         
         # Quit item
-        item_quit = Gtk.MenuItem(label="❌ Quit")
-        item_quit.connect("activate", lambda _: self._on_quit())
+        item_quit = self._image_item("application-exit", "Quit")
+        item_quit.connect("activate", self._on_quit_activate)
         menu.append(item_quit)
         
         menu.show_all()
         return menu
     
-    def _on_mute_toggled(self, widget: Gtk.CheckMenuItem) -> None:
+    def _on_settings_activate(self, _item: "Gtk.MenuItem") -> None:
+        """Open settings from the menu."""
+        self._on_settings()
+    
+    def _on_quit_activate(self, _item: "Gtk.MenuItem") -> None:
+        """Quit from the menu."""
+        self._on_quit()
+    
+    def _on_mute_toggled(self, widget: "Gtk.CheckMenuItem") -> None:
         """
         Handle mute toggle.
         
@@ -120,8 +195,18 @@ class SystemTray:
         self.config.set("muted", muted)
         status = "muted" if muted else "unmuted"
         logger.info(f"VoiceClock {status}")
+        
+        if self._on_mute_changed:
+            self._on_mute_changed(muted)
     
     def update_mute_state(self) -> None:
         """Sync the mute checkbox with config (e.g., after settings change)."""
-        if hasattr(self, 'item_mute'):
-            self.item_mute.set_active(self.config.get("muted", False))
+        if self.item_mute is None:
+            return
+        
+        muted = self.config.get("muted", False)
+        if self.item_mute.get_active() != muted:
+            # Block our handler so syncing the UI doesn't write config back
+            self.item_mute.handler_block_by_func(self._on_mute_toggled)
+            self.item_mute.set_active(muted)
+            self.item_mute.handler_unblock_by_func(self._on_mute_toggled)
@@ -0,0 +1,181 @@
+"""
+TTS text tables - Spoken time phrases for VoiceClock audio assets.
+
+Shared by the audio generation scripts so the English and Bangla
+wording is defined in one place.
+"""
+
+from typing import Generator
+
+
+# =============================================================================
+# BANGLA NUMBER MAPPINGS
+# =============================================================================
+
+# Bangla numerals for hours (1-12)
+BANGLA_HOURS = {
+    1: "একটা",
+    2: "দুইটা",
+    3: "তিনটা",
+    4: "চারটা",
+    5: "পাঁচটা",
+    6: "ছয়টা",
+    7: "সাতটা",
+    8: "আটটা",
+    9: "নয়টা",
+    10: "দশটা",
+    11: "এগারোটা",
+    12: "বারোটা",
+}
+
+# Bangla hour word for each hour, indexed by 24-hour time (0 and 12 -> বারোটা)
+BANGLA_HOUR_WORDS = tuple(BANGLA_HOURS[hour % 12 or 12] for hour in range(24))
+
+# Bangla minute phrases
+BANGLA_MINUTES = {
+    0: "",  # No minute suffix for :00
+    15: "বেজে পনেরো মিনিট",
+    30: "বেজে ত্রিশ মিনিট",
+    45: "বেজে পঁয়তাল্লিশ মিনিট",
+}
+
+
+# Bangla time-of-day phrase for each hour, indexed by 24-hour time
+BANGLA_TIME_OF_DAY = (
+    ("রাত",) * 4 +       # Night - 0:00 to 3:59
+    ("ভোর",) * 2 +       # Bhor (Dawn) - 4:00 to 5:59
+    ("সকাল",) * 6 +     # Morning - 6:00 to 11:59
+    ("দুপুর",) * 4 +     # Noon/Afternoon - 12:00 to 15:59
+    ("বিকেল",) * 2 +     # Late Afternoon - 16:00 to 17:59
+    ("সন্ধ্যা",) * 2 +    # Evening - 18:00 to 19:59
+    ("রাত",) * 4         # Night - 20:00 to 23:59
+)
+
+
+def get_bangla_time_of_day(hour_24: int) -> str:
+    """
+    Get the Bangla time-of-day phrase based on 24-hour time.
+    
+    Args:
+        hour_24: Hour in 24-hour format (0-23).
+        
+    Returns:
+        Bangla time-of-day string.
+    """
+    return BANGLA_TIME_OF_DAY[hour_24]
+
+
+def get_bangla_text(hour_24: int, minute: int) -> str:
+    """
+    Generate Bangla text for a given time.
+    
+    Args:
+        hour_24: Hour in 24-hour format (0-23).
+        minute: Minute (0, 15, 30, 45).
+        
+    Returns:
+        Bangla text string for TTS.
+    """
+    time_of_day = BANGLA_TIME_OF_DAY[hour_24]
+    hour_word = BANGLA_HOUR_WORDS[hour_24]
+    
+    if minute == 0:
+        # "এখন সময় দুপুর দুইটা"
+        return f"এখন সময় {time_of_day} {hour_word}"
+    else:
+        # "এখন সময় দুপুর দুইটা বেজে পনেরো মিনিট"
+        minute_phrase = BANGLA_MINUTES[minute]
+        return f"এখন সময় {time_of_day} {hour_word} {minute_phrase}"
+
+
+# =============================================================================
+# ENGLISH TEXT GENERATION
+# =============================================================================
+
+ENGLISH_HOURS = {
+    1: "one", 2: "two", 3: "three", 4: "four", 5: "five", 6: "six",
+    7: "seven", 8: "eight", 9: "nine", 10: "ten", 11: "eleven", 12: "twelve",
+}
+
+# English hour word for each hour, indexed by 24-hour time (0 and 12 -> twelve)
+ENGLISH_HOUR_WORDS = tuple(ENGLISH_HOURS[hour % 12 or 12] for hour in range(24))
+
+ENGLISH_MINUTES = {
+    0: "o'clock",
+    15: "fifteen",
+    30: "thirty",
+    45: "forty-five",
+}
+
+
+# English period phrase for each hour, indexed by 24-hour time
+ENGLISH_PERIODS = (
+    ("at night",) * 5 +          # 0:00 to 4:59
+    ("in the morning",) * 7 +    # 5:00 to 11:59
+    ("in the afternoon",) * 6 +  # 12:00 to 17:59
+    ("in the evening",) * 3 +    # 18:00 to 20:59
+    ("at night",) * 3            # 21:00 to 23:59
+)
+
+
+def get_english_period(hour_24: int) -> str:
+    """
+    Get AM/PM and descriptive period for English.
+    
+    Args:
+        hour_24: Hour in 24-hour format (0-23).
+        
+    Returns:
+        Period string (e.g., "in the morning", "PM").
+    """
+    return ENGLISH_PERIODS[hour_24]
+
+
+def get_english_text(hour_24: int, minute: int) -> str:
+    """
+    Generate natural English text for a given time.
+    
+    Args:
+        hour_24: Hour in 24-hour format (0-23).
+        minute: Minute (0, 15, 30, 45).
+        
+    Returns:
+        English text string for TTS.
+    """
+    hour_word = ENGLISH_HOUR_WORDS[hour_24]
+    period = ENGLISH_PERIODS[hour_24]
+    
+    if minute == 0:
+        # "It is two o'clock in the afternoon"
+        return f"It is {hour_word} o'clock {period}"
+    else:
+        # "It is two fifteen in the afternoon"
+        minute_word = ENGLISH_MINUTES[minute]
+        return f"It is {hour_word} {minute_word} {period}"
+
+
+# =============================================================================
+# TIME SLOTS
+# =============================================================================
+
+def generate_time_slots() -> Generator[tuple[int, int], None, None]:
+    """
+    Generate all time slots for a 24-hour cycle at 15-minute intervals.
+    
+    Yields:
+        Tuples of (hour, minute) for each time slot.
+    """
+    for hour in range(24):
+        for minute in (0, 15, 30, 45):
+            yield hour, minute
+
+
+# Precomputed (hour, minute, filename, text) for every slot, built once at import
+ENGLISH_TEXTS = tuple(
+    (hour, minute, f"{hour:02d}_{minute:02d}.mp3", get_english_text(hour, minute))
+    for hour, minute in generate_time_slots()
+)
+BANGLA_TEXTS = tuple(
+    (hour, minute, f"{hour:02d}_{minute:02d}.mp3", get_bangla_text(hour, minute))
+    for hour, minute in generate_time_slots()
+)